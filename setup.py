@@ -0,0 +1,27 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+"""Optional Cython build for the status_handling hot path.
+
+The package is pure Python by default.  If Cython is available at build time, the ``.pyx`` sources
+below are compiled to extension modules; the compiled module shadows the matching ``.py`` source
+at import time, which remains as a fallback for installs without a compiler.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        ["src/observability_charm_tools/status_handling/status_manager.pyx"],
+        compiler_directives={
+            "boundscheck": False,
+            "wraparound": False,
+            "nonecheck": False,
+            "language_level": 3,
+        },
+    )
+
+setup(ext_modules=ext_modules)
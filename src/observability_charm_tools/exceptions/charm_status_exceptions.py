@@ -1,25 +1,32 @@
 """Exceptions for expressing charm statuses."""
 
+from ops import BlockedStatus, MaintenanceStatus, WaitingStatus
+
 
 class BaseStatusError(Exception):
-    """Base exception for errors that should result in an ops status."""
+    """Base exception for errors that should result in an ops status.
+
+    Subclasses set status_type to the status class the error maps to, so StatusManager can
+    dispatch on the attribute directly.  This also means user-defined subclasses of these errors
+    are handled correctly without registering them in a status map.
+    """
 
-    pass
+    status_type = None
 
 
 class BlockedStatusError(BaseStatusError):
     """Raised when an error should result in a Blocked status."""
 
-    pass
+    status_type = BlockedStatus
 
 
 class WaitingStatusError(BaseStatusError):
     """Raised when an error should result in a Waiting status."""
 
-    pass
+    status_type = WaitingStatus
 
 
 class MaintenanceStatusError(BaseStatusError):
     """Raised when an error should result in a Maintenance status."""
 
-    pass
+    status_type = MaintenanceStatus
@@ -18,6 +18,33 @@ DEFAULT_STATUS_MAP = {
     MaintenanceStatusError: MaintenanceStatus,
 }
 
+# Statuses ranked by severity, starting with the worst.  Keyed by exact type so lookups are a
+# single dict probe rather than an isinstance MRO walk.
+_STATUS_RANK = {
+    BlockedStatus: 0,
+    WaitingStatus: 1,
+    MaintenanceStatus: 2,
+    ActiveStatus: 3,
+}
+
+# Rank given to statuses not in _STATUS_RANK - worse than nothing, never selected as best.
+_UNRANKED = len(_STATUS_RANK)
+
+# Shared result for worst() with no statuses - ops statuses compare by type and message, so
+# returning the same instance on every successful reconcile is safe.
+_EMPTY_ACTIVE = ActiveStatus("")
+
+
+def _isinstance_rank(status) -> int:
+    """Rank a status missed by the exact-type table, e.g. a subclass of an ops status (cold path).
+
+    Returns _UNRANKED if the status is not an instance of any ranked status class.
+    """
+    for status_class, rank in _STATUS_RANK.items():
+        if isinstance(status, status_class):
+            return rank
+    return _UNRANKED
+
 
 class StatusManager:
     """A context manager that catches known exceptions and maps them to charm statuses.
@@ -51,6 +78,9 @@ class StatusManager:
     ```
     """
 
+    # Slots make statuses/_status_map access a C-level slot read rather than a __dict__ lookup.
+    __slots__ = ("_statuses", "_status_map", "_append_status")
+
     def __init__(self, status_map: Optional[Dict[Type[Exception], Type[StatusBase]]] = None):
         """Return a StatusManager.
 
@@ -60,34 +90,61 @@ class StatusManager:
                         of the corresponding type.  The message on the status will be the same as the exception's
                         message, for example SomeException("message") will be stored as SomeStatus("message").
                         If an exception is raised and the type is not in the map, the exception will raise as normal.
+                        Exceptions deriving from BaseStatusError carry their status type as an
+                        attribute and are caught without needing a map entry.
         """
-        self.statuses = []
+        self._statuses = []
+        # Bind the list's append once so __exit__ skips the method lookup per caught exception.
+        self._append_status = self._statuses.append
         if not status_map:
             status_map = DEFAULT_STATUS_MAP
-        _validate_status_map(status_map)
+        if status_map is not DEFAULT_STATUS_MAP:
+            # The default map is validated once at import time, so only user maps need checking.
+            _validate_status_map(status_map)
         self._status_map = status_map
 
+    @property
+    def statuses(self) -> List[StatusBase]:
+        """Return the list of statuses caught so far."""
+        return self._statuses
+
+    @statuses.setter
+    def statuses(self, statuses: List[StatusBase]):
+        """Replace the list of statuses."""
+        self._statuses = statuses
+        self._append_status = statuses.append
+
     def __enter__(self):
         """Return self to be used as a context manager."""
         return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
+    def __exit__(self, exc_type, exc_val, exc_tb, _str=str):
         """Catch known exceptions and store a Status instead, otherwise allow to be raised."""
-        try:
-            status_type = self._status_map[exc_type]
-        except KeyError:
-            # Unknown exception - do not catch it.  This means python will raise it like normal.
+        # _str binds the str builtin as a local default to skip the LOAD_GLOBAL on every exit.
+        if exc_type is None:
+            # No exception was raised - nothing to do.
             return False
 
+        # Consult the map first so explicit configuration wins, then fall back to the status
+        # class the exception itself carries, which dispatches subclasses of the known errors
+        # without a map entry.
+        status_type = self._status_map.get(exc_type)
+        if status_type is None:
+            status_type = getattr(exc_val, "status_type", None)
+            if not (isinstance(status_type, type) and issubclass(status_type, StatusBase)):
+                # Unknown exception - do not catch it.  This means python will raise it like
+                # normal.
+                return False
+
         # Store a Status created using the message from the error
-        self.statuses.append(status_type(str(exc_val)))
+        self._append_status(status_type(_str(exc_val)))
 
         # Do not raise this known exception
         return True
 
     def __len__(self):
         """Return the number of statuses tracked by this manager."""
-        return len(self.statuses)
+        return len(self._statuses)
 
     def worst(self) -> StatusBase:
         """Return the worst status in the list, or ActiveStatus if len(statuses)==0.
@@ -99,25 +156,22 @@ class StatusManager:
             ActiveStatus
         """
         if len(self) == 0:
-            return ActiveStatus("")
+            return _EMPTY_ACTIVE
 
-        return get_first_worst_status(self.statuses)
+        # Always rescan - the public statuses list can be mutated in place (append, index or
+        # slice assignment), which a cached running best cannot detect.  The single-pass ranked
+        # scan keeps this cheap and still exits early on the first BlockedStatus.
+        return get_first_worst_status(self._statuses)
 
 
 def _validate_status_map(status_map: Dict[Type[Exception], Type[StatusBase]]):
     """Raise if the status map is invalid."""
     for exception_type, status_type in status_map.items():
-        try:
-            if not issubclass(exception_type, Exception):
-                raise TypeError(f"status_map key {exception_type} is not a subclass of Exception")
-        except TypeError as e:
-            raise TypeError(f"status_map key {exception_type} is not a class") from e
+        if not isinstance(exception_type, type) or not issubclass(exception_type, Exception):
+            raise TypeError(f"status_map key {exception_type} is not a subclass of Exception")
 
-        try:
-            if not issubclass(status_type, StatusBase):
-                raise TypeError(f"status_map value {status_type} is not a subclass of StatusBase")
-        except TypeError as e:
-            raise TypeError(f"status_map value {status_type} is not a class") from e
+        if not isinstance(status_type, type) or not issubclass(status_type, StatusBase):
+            raise TypeError(f"status_map value {status_type} is not a subclass of StatusBase")
 
 
 def get_first_worst_status(statuses: List[StatusBase]) -> StatusBase:
@@ -134,26 +188,27 @@ def get_first_worst_status(statuses: List[StatusBase]) -> StatusBase:
     if len(statuses) == 0:
         raise ValueError("No statuses provided")
 
-    blocked = None
-    waiting = None
-    maintenance = None
-    active = None
+    best_rank = len(_STATUS_RANK)
+    best_status = None
 
     for status in statuses:
-        if isinstance(status, BlockedStatus):
-            blocked = status
-            # Escape immediately, as this is the worst status
-            break
-        if isinstance(status, WaitingStatus):
-            waiting = waiting or status
-        elif isinstance(status, MaintenanceStatus):
-            maintenance = maintenance or status
-        elif isinstance(status, ActiveStatus):
-            active = active or status
-        else:
-            raise TypeError(
-                f"found status {status}, expected statuses of one of [BlockedStatus, WaitingStatus, MaintenanceStatus,"
-                f" ActiveStatus]"
-            )
-
-    return blocked or waiting or maintenance or active
+        rank = _STATUS_RANK.get(type(status))
+        if rank is None:
+            rank = _isinstance_rank(status)
+            if rank == _UNRANKED:
+                raise TypeError(
+                    f"found status {status}, expected statuses of one of [BlockedStatus, WaitingStatus,"
+                    f" MaintenanceStatus, ActiveStatus]"
+                )
+        if rank < best_rank:
+            best_rank = rank
+            best_status = status
+            if best_rank == 0:
+                # Escape immediately, as this is the worst status
+                break
+
+    return best_status
+
+
+# Validate the shared default map once at import; StatusManager.__init__ skips it thereafter.
+_validate_status_map(DEFAULT_STATUS_MAP)
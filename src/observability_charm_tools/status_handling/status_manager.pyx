@@ -0,0 +1,204 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+"""Cython build of status_manager.
+
+This mirrors status_manager.py and must be kept in sync with it.  When the package is built with
+Cython available, the compiled extension shadows the pure-Python module at import time; otherwise
+the ``.py`` source is used as a fallback.  See setup.py for the build configuration.
+"""
+
+cimport cython
+
+from ops import ActiveStatus, BlockedStatus, MaintenanceStatus, StatusBase, WaitingStatus
+
+from ..exceptions import (
+    BlockedStatusError,
+    MaintenanceStatusError,
+    WaitingStatusError,
+)
+
+DEFAULT_STATUS_MAP = {
+    BlockedStatusError: BlockedStatus,
+    WaitingStatusError: WaitingStatus,
+    MaintenanceStatusError: MaintenanceStatus,
+}
+
+# Statuses ranked by severity, starting with the worst.  Keyed by exact type so lookups are a
+# single dict probe rather than an isinstance MRO walk.
+_STATUS_RANK = {
+    BlockedStatus: 0,
+    WaitingStatus: 1,
+    MaintenanceStatus: 2,
+    ActiveStatus: 3,
+}
+
+# Rank given to statuses not in _STATUS_RANK - worse than nothing, never selected as best.
+_UNRANKED = len(_STATUS_RANK)
+
+# Shared result for worst() with no statuses - ops statuses compare by type and message, so
+# returning the same instance on every successful reconcile is safe.
+_EMPTY_ACTIVE = ActiveStatus("")
+
+
+def _isinstance_rank(status):
+    """Rank a status missed by the exact-type table, e.g. a subclass of an ops status (cold path).
+
+    Returns _UNRANKED if the status is not an instance of any ranked status class.
+    """
+    for status_class, rank in _STATUS_RANK.items():
+        if isinstance(status, status_class):
+            return rank
+    return _UNRANKED
+
+
+class StatusManager:
+    """A context manager that catches known exceptions and maps them to charm statuses.
+
+    This is useful when running a series of tasks, perhaps in a charm reconcile function, that each may succeed or
+    raise an Exception.  Use this context manager to collect all the statuses independently, then use the worst
+    status to set the unit status.
+
+    See the pure-Python status_manager module for example usage.
+    """
+
+    # Slots make statuses/_status_map access a C-level slot read rather than a __dict__ lookup.
+    __slots__ = ("_statuses", "_status_map", "_append_status")
+
+    def __init__(self, status_map=None):
+        """Return a StatusManager.
+
+        Args:
+            status_map: A dictionary mapping exception types to status types.  If an exception is raised inside the
+                        StatusManager's context, the StatusManager will catch that exception and instead store a Status
+                        of the corresponding type.  The message on the status will be the same as the exception's
+                        message, for example SomeException("message") will be stored as SomeStatus("message").
+                        If an exception is raised and the type is not in the map, the exception will raise as normal.
+                        Exceptions deriving from BaseStatusError carry their status type as an
+                        attribute and are caught without needing a map entry.
+        """
+        self._statuses = []
+        # Bind the list's append once so __exit__ skips the method lookup per caught exception.
+        self._append_status = self._statuses.append
+        if not status_map:
+            status_map = DEFAULT_STATUS_MAP
+        if status_map is not DEFAULT_STATUS_MAP:
+            # The default map is validated once at import time, so only user maps need checking.
+            _validate_status_map(status_map)
+        self._status_map = status_map
+
+    @property
+    def statuses(self):
+        """Return the list of statuses caught so far."""
+        return self._statuses
+
+    @statuses.setter
+    def statuses(self, statuses):
+        """Replace the list of statuses."""
+        self._statuses = statuses
+        self._append_status = statuses.append
+
+    def __enter__(self):
+        """Return self to be used as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Catch known exceptions and store a Status instead, otherwise allow to be raised."""
+        if exc_type is None:
+            # No exception was raised - nothing to do.
+            return False
+
+        # Consult the map first so explicit configuration wins, then fall back to the status
+        # class the exception itself carries, which dispatches subclasses of the known errors
+        # without a map entry.
+        status_type = self._status_map.get(exc_type)
+        if status_type is None:
+            status_type = getattr(exc_val, "status_type", None)
+            if not (isinstance(status_type, type) and issubclass(status_type, StatusBase)):
+                # Unknown exception - do not catch it.  This means python will raise it like
+                # normal.
+                return False
+
+        # Store a Status created using the message from the error
+        self._append_status(status_type(str(exc_val)))
+
+        # Do not raise this known exception
+        return True
+
+    def __len__(self):
+        """Return the number of statuses tracked by this manager."""
+        return len(self._statuses)
+
+    def worst(self):
+        """Return the worst status in the list, or ActiveStatus if len(statuses)==0.
+
+        Status are ranked, starting with the worst:
+            BlockedStatus
+            WaitingStatus
+            MaintenanceStatus
+            ActiveStatus
+        """
+        if len(self) == 0:
+            return _EMPTY_ACTIVE
+
+        # Always rescan - the public statuses list can be mutated in place (append, index or
+        # slice assignment), which a cached running best cannot detect.  The single-pass ranked
+        # scan keeps this cheap and still exits early on the first BlockedStatus.
+        return get_first_worst_status(self._statuses)
+
+
+def _validate_status_map(status_map):
+    """Raise if the status map is invalid."""
+    for exception_type, status_type in status_map.items():
+        if not isinstance(exception_type, type) or not issubclass(exception_type, Exception):
+            raise TypeError(f"status_map key {exception_type} is not a subclass of Exception")
+
+        if not isinstance(status_type, type) or not issubclass(status_type, StatusBase):
+            raise TypeError(f"status_map value {status_type} is not a subclass of StatusBase")
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.nonecheck(False)
+cpdef get_first_worst_status(list statuses):
+    """Return the first of the worst statuses in the list.
+
+    Raises if len(statuses) == 0.
+
+    Status are ranked, starting with the worst:
+        BlockedStatus
+        WaitingStatus
+        MaintenanceStatus
+        ActiveStatus
+    """
+    # Typing best_rank/rank makes the compare/update below a plain C integer compare.
+    cdef int best_rank = 4
+    cdef int rank
+    cdef object best_status = None
+    cdef object status
+    cdef object rank_obj
+
+    if len(statuses) == 0:
+        raise ValueError("No statuses provided")
+
+    for status in statuses:
+        rank_obj = _STATUS_RANK.get(type(status))
+        if rank_obj is None:
+            rank_obj = _isinstance_rank(status)
+            if rank_obj == _UNRANKED:
+                raise TypeError(
+                    f"found status {status}, expected statuses of one of [BlockedStatus, WaitingStatus,"
+                    f" MaintenanceStatus, ActiveStatus]"
+                )
+        rank = <int>rank_obj
+        if rank < best_rank:
+            best_rank = rank
+            best_status = status
+            if best_rank == 0:
+                # Escape immediately, as this is the worst status
+                break
+
+    return best_status
+
+
+# Validate the shared default map once at import; StatusManager.__init__ skips it thereafter.
+_validate_status_map(DEFAULT_STATUS_MAP)
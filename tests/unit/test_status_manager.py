@@ -3,6 +3,11 @@ from contextlib import nullcontext
 import pytest
 from ops import ActiveStatus, BlockedStatus, MaintenanceStatus, WaitingStatus
 
+from src.observability_charm_tools.exceptions import (
+    BlockedStatusError,
+    MaintenanceStatusError,
+    WaitingStatusError,
+)
 from src.observability_charm_tools.status_handling import StatusManager, get_first_worst_status
 
 
@@ -79,6 +84,67 @@ def test_status_manager_returns_first_worst_error(statuses, expected_status):
     assert status_manager.worst() == expected_status
 
 
+class SubclassedBlockedStatusError(BlockedStatusError):
+    pass
+
+
+@pytest.mark.parametrize(
+    "exceptions, expected_status",
+    [
+        # No exceptions caught
+        ([], ActiveStatus("")),
+        # A single known exception
+        ([WaitingStatusError("0")], WaitingStatus("0")),
+        # The worst of several caught exceptions
+        (
+            [MaintenanceStatusError("0"), BlockedStatusError("1"), WaitingStatusError("2")],
+            BlockedStatus("1"),
+        ),
+        # Subclasses of the known errors dispatch on their status_type attribute
+        ([SubclassedBlockedStatusError("0")], BlockedStatus("0")),
+    ],
+)
+def test_status_manager_worst_after_catching(exceptions, expected_status):
+    status_manager = StatusManager()
+    for exception in exceptions:
+        with status_manager:
+            raise exception
+    assert status_manager.worst() == expected_status
+
+
+def test_status_manager_custom_map_overrides_status_type_attribute():
+    status_manager = StatusManager(status_map={BlockedStatusError: WaitingStatus})
+    with status_manager:
+        raise BlockedStatusError("0")
+    assert status_manager.statuses == [WaitingStatus("0")]
+
+
+def test_status_manager_reraises_unrelated_status_type_attribute():
+    class NotAStatusError(Exception):
+        status_type = "not-a-class"
+
+    status_manager = StatusManager()
+    with pytest.raises(NotAStatusError):
+        with status_manager:
+            raise NotAStatusError("0")
+
+
+def test_status_manager_worst_detects_in_place_mutation():
+    status_manager = StatusManager()
+    with status_manager:
+        raise WaitingStatusError("w")
+    status_manager.statuses.append(BlockedStatus("b"))
+    assert status_manager.worst() == BlockedStatus("b")
+
+
+def test_status_manager_worst_detects_same_length_mutation():
+    status_manager = StatusManager()
+    with status_manager:
+        raise WaitingStatusError("w")
+    status_manager.statuses[0] = BlockedStatus("b")
+    assert status_manager.worst() == BlockedStatus("b")
+
+
 @pytest.mark.parametrize(
     "status_map",
     [
@@ -105,3 +171,11 @@ def test_get_first_worst_status_raises_on_empty_list():
 def test_get_first_worst_status_raises_on_wrong_status():
     with pytest.raises(TypeError):
         get_first_worst_status(["not a status"])
+
+
+def test_get_first_worst_status_accepts_status_subclasses():
+    class SubclassedBlockedStatus(BlockedStatus):
+        pass
+
+    statuses = [ActiveStatus("0"), SubclassedBlockedStatus("1")]
+    assert get_first_worst_status(statuses) == BlockedStatus("1")